@@ -2,10 +2,11 @@
 """
 Demonstration script for the Arlington Hockey Club roster crawler.
 
-This script imports the :func:`fetch_team_roster` function from the
+This script imports the :func:`fetch_team_roster_async` function from the
 ``fetch_team_roster`` module and uses it to retrieve rosters for a range of
-team IDs specified via command line arguments. The resulting pandas DataFrames 
-are concatenated into a single DataFrame and saved to a CSV file.
+team IDs specified via command line arguments.  Teams are downloaded
+concurrently with ``aiohttp`` and each team's rows are appended to a CSV
+file as soon as they arrive.
 
 Usage:
     python crawl_rosters.py <start_id> <num_teams>
@@ -20,18 +21,62 @@ The output CSV file will be named: ArlingtonIce-<start_id>-<end_id>.csv
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
+import os
 import pandas as pd  # type: ignore
+from typing import Any
 
-from fetch_team_roster import fetch_team_roster
+import aiohttp
+from fetch_team_roster import COLUMNS, fetch_team_roster_async
 import random
-import time
 import sys
 
 
+# Maximum number of roster pages downloaded at the same time.
+MAX_CONCURRENCY = 20
+
+
 # List of team IDs to fetch.  These values correspond to known teams on the
 # Arlington Hockey Club website.  You can add or remove IDs as needed.
 # Note: TEAM_IDS is now set dynamically based on command line arguments
 
+async def crawl(team_ids: range, writer: Any) -> int:
+    """Fetch the rosters for ``team_ids`` concurrently.
+
+    At most :data:`MAX_CONCURRENCY` requests are in flight at once.  Each
+    team's rows are passed to ``writer.writerows`` as soon as they arrive, so
+    rows appear in the order the downloads complete.  Teams that fail to
+    download are reported and skipped.  Returns the number of rows written.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    done = 0
+    written = 0
+
+    async def fetch(session: aiohttp.ClientSession, tid: int) -> None:
+        nonlocal done, written
+        async with semaphore:
+            await asyncio.sleep(random.uniform(0, 1))
+            try:
+                rows = await fetch_team_roster_async(session, tid)
+            except Exception as exc:
+                print(f"Failed to fetch team {tid}: {exc}")
+                return
+        writer.writerows(rows)
+        written += len(rows)
+        done += 1
+        print('.', end='', file=sys.stderr, flush=True)
+        if done % 10 == 0:
+            print(' ', end='', file=sys.stderr, flush=True)
+        if done % 50 == 0:
+            print('\n', end='', file=sys.stderr, flush=True)
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(fetch(session, tid) for tid in team_ids))
+    return written
+
+
 def main() -> None:
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Crawl hockey team rosters')
@@ -44,36 +89,29 @@ def main() -> None:
     end_id = start_id + args.num_teams - 1
     team_ids = range(start_id, start_id + args.num_teams)
     
-    # Collect DataFrames for each team
-    frames: list[pd.DataFrame] = []
-    for tid in team_ids:
-        time.sleep(random.uniform(0, 1))
-        try:
-            df = fetch_team_roster(tid)
-            print('.', end='', file=sys.stderr, flush=True)
-            if (tid - start_id + 1) % 10 == 0:
-                print(' ', end='', file=sys.stderr, flush=True)
-            if (tid - start_id + 1) % 50 == 0:
-                print('\n', end='', file=sys.stderr, flush=True)
-        except Exception as exc:
-            print(f"Failed to fetch team {tid}: {exc}")
-            continue
-        frames.append(df)
-
-    if not frames:
+    # Stream the player rows of every team to a CSV file with the specified
+    # naming format, so that partial progress survives a crash
+    filename = f"ArlingtonIce-{start_id}-{end_id}.csv"
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        written = asyncio.run(crawl(team_ids, writer))
+
+    if not written:
+        os.remove(filename)
         print("No data retrieved.")
         return
 
-    # Concatenate results into a single DataFrame
-    combined = pd.concat(frames, ignore_index=True)
-    combined['team_id'] = combined['team_id'].astype(int)
-    
-    # Save to CSV with specified naming format
-    filename = f"ArlingtonIce-{start_id}-{end_id}.csv"
-    combined.to_csv(filename, index=False)
     print(f"\nData saved to {filename}", file=sys.stderr)
     
-    # Display the combined DataFrame
+    # Display the combined DataFrame.  Season and team name repeat for
+    # every player on a team, so store them as categories, and hold the
+    # fetch timestamps as datetime64 rather than ISO strings.
+    combined = pd.read_csv(
+        filename,
+        dtype={'team_id': 'int32', 'season': 'category', 'team_name': 'category'},
+        parse_dates=['fetched_at'],
+    )
     print(combined)
 
 
@@ -2,9 +2,9 @@
 Module for fetching and parsing Arlington Hockey Club team roster pages.
 
 This module exposes a single function, :func:`fetch_team_roster`, which takes
-an integer team identifier and returns a pandas :class:`~pandas.DataFrame`
-containing one row per player.  The returned frame has the following
-columns:
+an integer team identifier and returns a list of tuples containing one row
+per player.  Each row holds the following fields, in the order given by
+:data:`COLUMNS`:
 
 * ``team_id`` – the numeric ID passed to the function.
 * ``season`` – a string describing the season (e.g. "23/24 Season").
@@ -14,34 +14,104 @@ columns:
   retrieved.
 
 Under the hood this function uses ``requests`` to download the roster page
-and BeautifulSoup to parse the HTML.  A custom User‑Agent and basic Accept
-headers are included by default to mimic a modern browser, which helps to
-avoid simple bot blocking.
+and selectolax (backed by the Lexbor engine) to parse the HTML.  A custom
+User‑Agent and basic Accept headers are included by default to mimic a modern
+browser, which helps to avoid simple bot blocking.
+
+Rows are returned as plain tuples so that callers fetching many teams can
+collect them and build a single DataFrame at the end, e.g. with
+``pd.DataFrame.from_records(rows, columns=COLUMNS)``.
 
 Example
 -------
 
-    >>> from fetch_team_roster import fetch_team_roster
-    >>> df = fetch_team_roster(19120)
-    >>> print(df.head())
+    >>> import pandas as pd
+    >>> from fetch_team_roster import COLUMNS, fetch_team_roster
+    >>> rows = fetch_team_roster(19120)
+    >>> print(pd.DataFrame.from_records(rows, columns=COLUMNS).head())
 
 Dependencies
 ------------
 
-The function requires the third‑party libraries ``requests``, ``bs4`` and
-``pandas``.  These can be installed via ``pip install -r requirements.txt``.
+The function requires the third‑party libraries ``requests`` and
+``selectolax``.  These can be installed via ``pip install -r requirements.txt``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-import pandas as pd  # type: ignore
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
+
+__all__ = [
+    "COLUMNS",
+    "RosterRow",
+    "fetch_team_roster",
+    "fetch_team_roster_async",
+    "parse_roster_html",
+]
+
+# Names of the fields in each row returned by :func:`fetch_team_roster`.
+COLUMNS = ("team_id", "season", "team_name", "player_name", "fetched_at")
+
+# A single player row: (team_id, season, team_name, player_name, fetched_at).
+RosterRow = Tuple[int, Optional[str], Optional[str], str, str]
+
+
+# Headers that resemble a modern browser.  These help to circumvent basic
+# blocking techniques employed by some servers.
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/115.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def _make_session() -> requests.Session:
+    """Create a session that pools connections and retries server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            # Let raise_for_status() report the final response as HTTPError.
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session so that consecutive fetches reuse the same TCP/TLS
+# connection to the server instead of opening a new one per team.
+_SESSION = _make_session()
+
+
+def _roster_url(team_id: int) -> str:
+    """Return the URL of the roster page for ``team_id``."""
+    return f"https://www.arlingtonice.com/team/{team_id}/roster"
+
 
-__all__ = ["fetch_team_roster"]
+def _build_headers(extra_headers: Optional[dict] = None) -> dict:
+    """Return the request headers, merged with any ``extra_headers``."""
+    # The defaults are shared between calls and must not be mutated; both
+    # requests and aiohttp copy the headers they are given.
+    if not extra_headers:
+        return _DEFAULT_HEADERS
+    return {**_DEFAULT_HEADERS, **extra_headers}
 
 
 def fetch_team_roster(
@@ -49,7 +119,8 @@ def fetch_team_roster(
     *,
     timeout: int = 30,
     extra_headers: Optional[dict] = None,
-) -> pd.DataFrame:
+    session: Optional[requests.Session] = None,
+) -> List[RosterRow]:
     """Fetch roster information for a given team.
 
     Parameters
@@ -65,12 +136,16 @@ def fetch_team_roster(
         Optional additional HTTP headers to merge into the request.  This
         argument can be used to supply cookies or other custom values
         required by the server.
+    session:
+        Optional :class:`requests.Session` used to issue the request.  By
+        default a module-level session with connection pooling and retries
+        is used.
 
     Returns
     -------
-    pandas.DataFrame
-        A DataFrame with one row per player.  See module docstring for
-        column descriptions.
+    list of tuple
+        One row per player, with fields ordered as in :data:`COLUMNS`.  See
+        module docstring for field descriptions.
 
     Raises
     ------
@@ -79,90 +154,144 @@ def fetch_team_roster(
     requests.RequestException
         For network or connection related errors.
     """
-    url = f"https://www.arlingtonice.com/team/{team_id}/roster"
-
-    # Construct headers that resemble a modern browser.  These help to
-    # circumvent basic blocking techniques employed by some servers.
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/115.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    if extra_headers:
-        headers.update(extra_headers)
-
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    if session is None:
+        session = _SESSION
+    resp = session.get(
+        _roster_url(team_id), headers=_build_headers(extra_headers), timeout=timeout
+    )
     resp.raise_for_status()
+    return parse_roster_html(resp.text, team_id)
+
+
+async def fetch_team_roster_async(
+    session: aiohttp.ClientSession,
+    team_id: int,
+    *,
+    timeout: int = 30,
+    extra_headers: Optional[dict] = None,
+) -> List[RosterRow]:
+    """Asynchronously fetch roster information for a given team.
+
+    This mirrors :func:`fetch_team_roster` but downloads the page with an
+    ``aiohttp`` session so that many teams can be fetched concurrently.  The
+    HTML is parsed in the event loop's default executor so that parsing does
+    not block other downloads.
+
+    Parameters
+    ----------
+    session:
+        The :class:`aiohttp.ClientSession` used to issue the request.
+    team_id, timeout, extra_headers:
+        As for :func:`fetch_team_roster`.
+
+    Returns
+    -------
+    list of tuple
+        One row per player, with fields ordered as in :data:`COLUMNS`.  See
+        module docstring for field descriptions.
+
+    Raises
+    ------
+    aiohttp.ClientResponseError
+        If the server responds with a non‑200 status code.
+    aiohttp.ClientError
+        For network or connection related errors.
+    """
+    async with session.get(
+        _roster_url(team_id),
+        headers=_build_headers(extra_headers),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as resp:
+        resp.raise_for_status()
+        text = await resp.text()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_roster_html, text, team_id)
+
+
+def _is_name(text: str) -> bool:
+    """Return whether ``text`` could be part of a player's name.
+
+    Empty strings, numbers (jersey numbers) and single characters such as
+    ``#`` are rejected.
+    """
+    return len(text) > 1 and not text.isdigit()
+
 
-    # Parse the HTML using BeautifulSoup
-    soup = BeautifulSoup(resp.text, "html.parser")
+def parse_roster_html(html: str, team_id: int) -> List[RosterRow]:
+    """Parse the HTML of a team roster page.
+
+    Parameters
+    ----------
+    html:
+        The raw HTML of the roster page.
+    team_id:
+        The numeric identifier of the team the page belongs to.
+
+    Returns
+    -------
+    list of tuple
+        One row per player, with fields ordered as in :data:`COLUMNS`.  See
+        module docstring for field descriptions.
+    """
+    # Parse the HTML using selectolax's Lexbor backend, a C parser that is
+    # considerably faster than BeautifulSoup
+    tree = LexborHTMLParser(html)
 
     # Extract team header information
-    header = soup.find("div", class_="team_header")
+    header = tree.css_first("div.team_header")
     season = None
     team_name = None
     if header:
-        span = header.find("span", class_="label label-org")
+        span = header.css_first("span.label.label-org")
         if span:
-            season = span.get_text(strip=True)
-        h1 = header.find("h1")
+            season = span.text(strip=True)
+        h1 = header.css_first("h1")
         if h1:
-            team_name = h1.get_text(strip=True)
+            team_name = h1.text(strip=True)
 
     # Extract players: need to handle different HTML structures for names
     players: List[str] = []
-    for participant in soup.select("div.participant.roster"):
-        first_name = None
-        last_name = None
-        
-        # Try to find first name in h3 tag
-        first = participant.find("h3")
-        if first:
-            first_name = first.get_text(strip=True)
-        
+    for participant in tree.css("div.participant.roster"):
+        # The first name lives in an h3 tag.  Entries without one are never
+        # recorded, so skip them before searching for a last name.
+        first = participant.css_first("h3")
+        first_name = first.text(strip=True) if first else None
+        if not first_name:
+            continue
+
         # Try to find last name - look for h2 that doesn't contain only numbers (jersey numbers)
-        h2_elements = participant.find_all("h2")
-        for h2 in h2_elements:
-            text = h2.get_text(strip=True)
-            # Skip if it's just a number (jersey number), empty, or just a symbol
-            if text and not text.isdigit() and text != "#" and len(text) > 1:
+        last_name = None
+        for h2 in participant.css("h2"):
+            text = h2.text(strip=True)
+            if _is_name(text):
                 last_name = text
                 break
-        
+
         # If we still don't have a last name, try looking in other elements
         if not last_name:
             # Look for any text that might be a last name in other tags
-            for element in participant.find_all(['span', 'div', 'p']):
-                text = element.get_text(strip=True)
-                # Skip empty, numeric, symbol-only, or very short text that's likely not a name
-                if (text and not text.isdigit() and text != "#" and len(text) > 1 
-                    and text != first_name and not text.startswith('#')):
-                    # Check if this could be a last name (contains letters, reasonable length)
-                    if any(c.isalpha() for c in text) and len(text) <= 30:
-                        last_name = text
-                        break
-        
+            for element in participant.css("span, div, p"):
+                # Unlike BeautifulSoup's find_all, css() also matches the
+                # participant div itself, whose text spans the whole entry
+                if element == participant:
+                    continue
+                text = element.text(strip=True)
+                if (_is_name(text) and text != first_name and not text.startswith('#')
+                        and any(c.isalpha() for c in text) and len(text) <= 30):
+                    last_name = text
+                    break
+
         # If we have a first name but no valid last name, skip this entry
         # (This avoids entries like "Christopher #")
-        if first_name and last_name and last_name != "#":
+        if last_name:
             players.append(f"{first_name} {last_name}")
-        elif first_name and not last_name:
+        else:
             # For debugging: print when we can't find a last name
             print(f"Warning: Could not find last name for first name '{first_name}' in team {team_id}", file=__import__('sys').stderr)
 
     # Timestamp the retrieval in UTC for reproducibility
     fetched_at = _dt.datetime.utcnow().isoformat()
 
-    # Build DataFrame with one row per player
-    data = {
-        "team_id": [team_id] * len(players),
-        "season": [season] * len(players),
-        "team_name": [team_name] * len(players),
-        "player_name": players,
-        "fetched_at": [fetched_at] * len(players),
-    }
-    return pd.DataFrame(data)
+    # Build one row per player
+    return [(team_id, season, team_name, player, fetched_at) for player in players]
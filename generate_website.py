@@ -7,19 +7,103 @@ This script reads all CSV files in the current directory that match the pattern
 - A home page listing all unique players
 - Individual player pages showing their teams and teammates
 
+Each HTML page is also saved gzip-compressed next to it as '<page>.html.gz'.
+
 The website is generated in an 'html_output' directory.
 """
 
 from __future__ import annotations
 
 import glob
+import gzip
 import os
+import re
+import shutil
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 import html
 
 
+# Matches the two years of a season, e.g. '2025/2026 SEASON' or '23/24 Season'
+_SEASON_RE = re.compile(r'(\d{2,4})[\s/\\-]+(\d{2,4})')
+
+
+def _expand_year(years: pd.Series) -> pd.Series:
+    """Expand 2-digit years to 4-digit (00-49 -> 20xx, 50-99 -> 19xx)."""
+    century = pd.Series(
+        np.where(pd.to_numeric(years, errors='coerce') < 50, '20', '19'),
+        index=years.index,
+    )
+    return years.mask(years.str.len() == 2, century + years)
+
+
+def normalize_seasons(seasons: pd.Series) -> pd.Series:
+    """Format season strings as 'YYYY/YYYY' where two years can be found.
+
+    Seasons that do not contain two years are returned unchanged.
+    """
+    extracted = seasons.str.extract(_SEASON_RE)
+    normalized = _expand_year(extracted[0]) + '/' + _expand_year(extracted[1])
+    return normalized.fillna(seasons)
+
+
+# Names are escaped many times over (once per teammate link), so memoize
+escape = lru_cache(maxsize=None)(html.escape)
+
+
+# Deletes every ASCII character that is not alphanumeric or one of '._-'
+_UNSAFE_ASCII = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in "._-")
+))
+
+
+def _strip_unsafe(text: str) -> str:
+    """Remove characters that are not alphanumeric or one of '._-'."""
+    if text.isascii():
+        return text.translate(_UNSAFE_ASCII)
+    return "".join(c for c in text if c.isalnum() or c in "._-")
+
+
+@lru_cache(maxsize=None)
+def player_filename(player_name: str) -> str:
+    """Return the safe filename (without extension) of a player's page."""
+    return _strip_unsafe(player_name.replace(" ", "_").replace("/", "_").replace("\\", "_"))
+
+
+@lru_cache(maxsize=None)
+def player_link(player_name: str, base: str = "") -> str:
+    """Return the link to a player's page, relative to ``base``."""
+    return (
+        f'<a href="{base}players/{player_filename(player_name)}.html" '
+        f'class="player-link">{escape(player_name)}</a>'
+    )
+
+
+def team_filename(team_id, season: str) -> str:
+    """Return the safe filename (without extension) of a team's page."""
+    return _strip_unsafe(f"{team_id}_{season.replace('/', '_').replace(' ', '_')}")
+
+
+def read_csv(file: str) -> Optional[pd.DataFrame]:
+    """Read one ArlingtonIce CSV file, or return None if it cannot be read."""
+    try:
+        df = pd.read_csv(file, engine='pyarrow', dtype_backend='pyarrow')
+        df['season'] = normalize_seasons(df['season'].astype(str))
+        # Duplicate rows can only come from the same crawl (each crawl stamps
+        # its own fetched_at), so deduplicating per file is sufficient
+        df = df.drop_duplicates()
+        df['team_id'] = df['team_id'].astype('int32')
+        print(f"Loaded {len(df)} records from {file}")
+        return df
+    except Exception as e:
+        print(f"Error reading {file}: {e}")
+        return None
+
+
 def read_all_csvs() -> pd.DataFrame:
     """Read all ArlingtonIce CSV files and combine them into a single DataFrame."""
     csv_files = glob.glob("ArlingtonIce-*.csv")
@@ -29,30 +113,9 @@ def read_all_csvs() -> pd.DataFrame:
     
     print(f"Found {len(csv_files)} CSV files: {csv_files}")
     
-    dataframes = []
-    import re
-    def normalize_season(season_str):
-        # Try to extract two years and format as 'YYYY/YYYY'
-        # Handles formats like '2025/2026 SEASON', '23/24 Season', etc.
-        match = re.search(r'(\d{2,4})[\s/\\-]+(\d{2,4})', season_str)
-        if match:
-            y1, y2 = match.groups()
-            # Expand 2-digit years to 4-digit
-            if len(y1) == 2:
-                y1 = '20' + y1 if int(y1) < 50 else '19' + y1
-            if len(y2) == 2:
-                y2 = '20' + y2 if int(y2) < 50 else '19' + y2
-            return f"{y1}/{y2}"
-        return season_str
-
-    for file in csv_files:
-        try:
-            df = pd.read_csv(file)
-            df['season'] = df['season'].astype(str).apply(normalize_season)
-            dataframes.append(df)
-            print(f"Loaded {len(df)} records from {file}")
-        except Exception as e:
-            print(f"Error reading {file}: {e}")
+    # The pyarrow parser releases the GIL, so files can be read in parallel
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        dataframes = [df for df in executor.map(read_csv, csv_files) if df is not None]
     
     if not dataframes:
         raise ValueError("No data could be loaded from CSV files")
@@ -60,13 +123,21 @@ def read_all_csvs() -> pd.DataFrame:
     combined_df = pd.concat(dataframes, ignore_index=True)
     print(f"Combined dataset has {len(combined_df)} total records")
     
-    return combined_df.drop_duplicates()
+    # Names and seasons repeat across many rows; categories shrink the frame
+    # and make grouping compare integer codes.  This is done after the
+    # concat because concatenating categoricals with differing categories
+    # falls back to object dtype.
+    return combined_df.astype(
+        {'season': 'category', 'team_name': 'category', 'player_name': 'category'}
+    )
 
 
 def create_output_directory() -> Path:
-    """Create the output directory for HTML files."""
+    """Create the output directory for HTML files, with its players/ and teams/ subdirectories."""
     output_dir = Path("docs")
     output_dir.mkdir(exist_ok=True)
+    (output_dir / "players").mkdir(exist_ok=True)
+    (output_dir / "teams").mkdir(exist_ok=True)
     return output_dir
 
 
@@ -92,45 +163,68 @@ def get_unique_teams(df: pd.DataFrame) -> List[Dict]:
     return sorted(teams, key=lambda x: (x['season'], x['team_name']))
 
 
-def get_team_data(df: pd.DataFrame, team_id: float, season: str) -> Dict:
+def build_team_rosters(df: pd.DataFrame) -> Dict[Tuple, List[str]]:
+    """Map each (team_id, season) to the sorted names of its players."""
+    indices = df.groupby(['team_id', 'season'], observed=True, sort=False).indices
+    names = df['player_name'].to_numpy(dtype=object)
+    return {key: sorted(set(names[idx])) for key, idx in indices.items()}
+
+
+def build_player_teams(df: pd.DataFrame) -> Dict[str, List[Dict]]:
+    """Map each player name to the teams (team_id, season, team_name) they played on."""
+    indices = df.groupby('player_name', observed=True, sort=False).indices
+    teams = list(zip(
+        df['team_id'].tolist(),
+        df['season'].tolist(),
+        df['team_name'].tolist(),
+    ))
+    return {
+        player: [
+            {'team_id': team_id, 'season': season, 'team_name': team_name}
+            # dict.fromkeys drops repeated teams while keeping their order
+            for team_id, season, team_name in dict.fromkeys(teams[i] for i in idx)
+        ]
+        for player, idx in indices.items()
+    }
+
+
+def get_team_data(team_rosters: Dict[Tuple, List[str]], team: Dict) -> Dict:
     """Get all player information for a specific team."""
-    team_data = df[(df['team_id'] == team_id) & (df['season'] == season)].copy()
+    team_id = team['team_id']
+    season = team['season']
+    players = team_rosters.get((team_id, season))
     
-    if team_data.empty:
+    if not players:
         return None
     
-    # Get team info
-    team_name = team_data['team_name'].iloc[0]
-    players = sorted(team_data['player_name'].unique())
-    
     return {
         'team_id': team_id,
-        'team_name': team_name,
+        'team_name': team['team_name'],
         'season': season,
         'players': players
     }
 
 
-def get_player_data(df: pd.DataFrame, player_name: str) -> Dict:
+def get_player_data(
+    player_teams: Dict[str, List[Dict]],
+    team_rosters: Dict[Tuple, List[str]],
+    player_name: str,
+) -> Dict:
     """Get all team and teammate information for a specific player."""
-    player_data = df[df['player_name'] == player_name].copy()
-    
     teams_info = []
-    for _, row in player_data.iterrows():
-        team_id = row['team_id']
-        season = row['season']
-        team_name = row['team_name']
+    for team in player_teams[player_name]:
+        team_id = team['team_id']
+        season = team['season']
         
         # Get all teammates for this team
-        teammates = df[
-            (df['team_id'] == team_id) & 
-            (df['player_name'] != player_name)
-        ]['player_name'].sort_values().tolist()
+        teammates = [
+            p for p in team_rosters[(team_id, season)] if p != player_name
+        ]
         
         teams_info.append({
             'team_id': team_id,
             'season': season,
-            'team_name': team_name,
+            'team_name': team['team_name'],
             'teammates': teammates
         })
     
@@ -278,18 +372,28 @@ def generate_css() -> str:
     """
 
 
+# The stylesheet shared by every page, written once to styles.css
+_CSS = generate_css()
+
+
+def write_stylesheet(output_dir: Path) -> None:
+    """Write the shared stylesheet that every page links to."""
+    with open(output_dir / "styles.css", "w", encoding="utf-8") as f:
+        f.write(_CSS)
+
+
 def generate_home_page(players: List[str], teams: List[Dict], output_dir: Path) -> None:
     """Generate the home page with all players and teams listed."""
     player_count = len(players)
     team_count = len(teams)
     
-    html_content = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Arlington Hockey Club - Player Directory</title>
-    <style>{generate_css()}</style>
+    <link rel="stylesheet" href="styles.css">
 </head>
 <body>
     <div class="header">
@@ -308,16 +412,12 @@ def generate_home_page(players: List[str], teams: List[Dict], output_dir: Path)
         <p>Click on any player name to see their team history and teammates:</p>
         
         <div class="player-grid">
-"""
+"""]
     
     for player in players:
-        # Create a safe filename by replacing problematic characters
-        safe_filename = player.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
-        
-        html_content += f'            <a href="players/{safe_filename}.html" class="player-link">{html.escape(player)}</a>\n'
+        parts.append(f'            {player_link(player)}\n')
     
-    html_content += """        </div>
+    parts.append("""        </div>
         
         <div class="section-header">
             <h3>🏒 Teams</h3>
@@ -325,26 +425,22 @@ def generate_home_page(players: List[str], teams: List[Dict], output_dir: Path)
         <p>Click on any team to see the roster for that season:</p>
         
         <div class="team-grid">
-"""
+""")
     
     for team in teams:
-        # Create a safe filename for team pages
-        safe_filename = f"{team['team_id']}_{team['season'].replace('/', '_').replace(' ', '_')}"
-        safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
-        
-        html_content += f"""            <a href="teams/{safe_filename}.html" class="team-link">
-                <div class="team-name">{html.escape(team['team_name'])}</div>
-                <div class="team-season">{html.escape(team['season'])}</div>
+        parts.append(f"""            <a href="teams/{team_filename(team['team_id'], team['season'])}.html" class="team-link">
+                <div class="team-name">{escape(team['team_name'])}</div>
+                <div class="team-season">{escape(team['season'])}</div>
             </a>
-"""
+""")
     
-    html_content += """        </div>
+    parts.append("""        </div>
     </div>
 </body>
-</html>"""
+</html>""")
     
     with open(output_dir / "index.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.write(''.join(parts))
 
 
 def generate_player_page(player_data: Dict, output_dir: Path) -> None:
@@ -359,25 +455,24 @@ def generate_player_page(player_data: Dict, output_dir: Path) -> None:
     teams = sorted(player_data['teams'], key=lambda t: season_key(t['season']))
     
     # Create safe filename
-    safe_filename = player_name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-    safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
+    safe_filename = player_filename(player_name)
     
     # Count total teammates
     all_teammates = set()
     for team in teams:
         all_teammates.update(team['teammates'])
     
-    html_content = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(player_name)} - Arlington Hockey Club</title>
-    <style>{generate_css()}</style>
+    <title>{escape(player_name)} - Arlington Hockey Club</title>
+    <link rel="stylesheet" href="../styles.css">
 </head>
 <body>
     <div class="header">
-        <h1>🏒 {html.escape(player_name)}</h1>
+        <h1>🏒 {escape(player_name)}</h1>
         <h2>Player Profile</h2>
     </div>
     
@@ -389,40 +484,34 @@ def generate_player_page(player_data: Dict, output_dir: Path) -> None:
         </div>
         
         <h3>Team History</h3>
-"""
+"""]
     
     for i, team in enumerate(teams, 1):
-        teammates_html = ""
         if team['teammates']:
-            teammates_html = '<div class="teammates">'
-            for teammate in team['teammates']:
-                teammate_filename = teammate.replace(" ", "_").replace("/", "_").replace("\\", "_")
-                teammate_filename = "".join(c for c in teammate_filename if c.isalnum() or c in "._-")
-                teammates_html += f'<div class="teammate"><a href="../players/{teammate_filename}.html" class="player-link">{html.escape(teammate)}</a></div>'
-            teammates_html += '</div>'
+            teammates_html = '<div class="teammates">' + ''.join(
+                f'<div class="teammate">{player_link(teammate, "../")}</div>'
+                for teammate in team['teammates']
+            ) + '</div>'
         else:
             teammates_html = '<p><em>No other teammates recorded</em></p>'
-        html_content += f"""
+        parts.append(f"""
         <div class="team-card">
             <div class="team-header">
-                <strong>Team #{i}: {html.escape(team['team_name'])}</strong>
+                <strong>Team #{i}: {escape(team['team_name'])}</strong>
                 <br>
-                <small>Season: {html.escape(team['season'])} | Team ID: {team['team_id']}</small>
+                <small>Season: {escape(team['season'])} | Team ID: {team['team_id']}</small>
             </div>
             <p><strong>Teammates ({len(team['teammates'])}):</strong></p>
             {teammates_html}
         </div>
-"""
+""")
     
-    html_content += """    </div>
+    parts.append("""    </div>
 </body>
-</html>"""
-    
-    players_dir = output_dir / "players"
-    players_dir.mkdir(exist_ok=True)
+</html>""")
     
-    with open(players_dir / f"{safe_filename}.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(output_dir / "players" / f"{safe_filename}.html", "w", encoding="utf-8") as f:
+        f.write(''.join(parts))
 
 
 def generate_team_page(team_data: Dict, output_dir: Path) -> None:
@@ -433,21 +522,20 @@ def generate_team_page(team_data: Dict, output_dir: Path) -> None:
     players = team_data['players']
     
     # Create safe filename
-    safe_filename = f"{team_id}_{season.replace('/', '_').replace(' ', '_')}"
-    safe_filename = "".join(c for c in safe_filename if c.isalnum() or c in "._-")
+    safe_filename = team_filename(team_id, season)
     
-    html_content = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(team_name)} ({html.escape(season)}) - Arlington Hockey Club</title>
-    <style>{generate_css()}</style>
+    <title>{escape(team_name)} ({escape(season)}) - Arlington Hockey Club</title>
+    <link rel="stylesheet" href="../styles.css">
 </head>
 <body>
     <div class="header">
-        <h1>🏒 {html.escape(team_name)}</h1>
-        <h2>{html.escape(season)}</h2>
+        <h1>🏒 {escape(team_name)}</h1>
+        <h2>{escape(season)}</h2>
     </div>
     
     <div class="container">
@@ -461,25 +549,57 @@ def generate_team_page(team_data: Dict, output_dir: Path) -> None:
         <p>Click on any player name to see their complete team history:</p>
         
         <div class="player-grid">
-"""
+"""]
     
     for player in players:
-        # Create safe filename for player pages
-        safe_player_filename = player.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        safe_player_filename = "".join(c for c in safe_player_filename if c.isalnum() or c in "._-")
-        
-        html_content += f'            <a href="../players/{safe_player_filename}.html" class="player-link">{html.escape(player)}</a>\n'
+        parts.append(f'            {player_link(player, "../")}\n')
     
-    html_content += """        </div>
+    parts.append("""        </div>
     </div>
 </body>
-</html>"""
+</html>""")
     
-    teams_dir = output_dir / "teams"
-    teams_dir.mkdir(exist_ok=True)
-    
-    with open(teams_dir / f"{safe_filename}.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(output_dir / "teams" / f"{safe_filename}.html", "w", encoding="utf-8") as f:
+        f.write(''.join(parts))
+
+
+def compress_file(path: Path) -> None:
+    """Write a gzip-compressed copy of ``path`` next to it as ``<path>.gz``."""
+    # mtime=0 keeps the output identical between runs for unchanged pages
+    with open(path, "rb") as fi, gzip.GzipFile(
+        f"{path}.gz", "wb", compresslevel=9, mtime=0
+    ) as fo:
+        shutil.copyfileobj(fi, fo)
+
+
+# Per-process state for the page rendering workers, set by _init_worker
+_worker_state: Dict = {}
+
+
+def _init_worker(
+    player_teams: Dict[str, List[Dict]],
+    team_rosters: Dict[Tuple, List[str]],
+    output_dir: Path,
+) -> None:
+    """Store the roster indexes in a worker process."""
+    _worker_state['player_teams'] = player_teams
+    _worker_state['team_rosters'] = team_rosters
+    _worker_state['output_dir'] = output_dir
+
+
+def _render_player(player: str) -> None:
+    """Generate the page for one player in a worker process."""
+    player_data = get_player_data(
+        _worker_state['player_teams'], _worker_state['team_rosters'], player
+    )
+    generate_player_page(player_data, _worker_state['output_dir'])
+
+
+def _render_team(team: Dict) -> None:
+    """Generate the page for one team in a worker process."""
+    team_data = get_team_data(_worker_state['team_rosters'], team)
+    if team_data:
+        generate_team_page(team_data, _worker_state['output_dir'])
 
 
 def main() -> None:
@@ -504,28 +624,45 @@ def main() -> None:
     teams = get_unique_teams(df)
     print(f"Found {len(teams)} unique teams")
     
+    # Index rosters and team memberships once so that building each page is
+    # a dictionary lookup rather than a scan of the whole DataFrame
+    print("🗂️ Indexing rosters...")
+    team_rosters = build_team_rosters(df)
+    player_teams = build_player_teams(df)
+    
+    # Write the stylesheet shared by all pages
+    print("🎨 Writing stylesheet...")
+    write_stylesheet(output_dir)
+    
     # Generate home page
     print("🏠 Generating home page...")
     generate_home_page(players, teams, output_dir)
     
-    # Generate individual player pages
-    print("👤 Generating player pages...")
-    for i, player in enumerate(players, 1):
-        if i % 50 == 0:
-            print(f"  Generated {i}/{len(players)} player pages...")
+    # Pages are independent of each other, so render them across a pool of
+    # worker processes.  The indexes are sent to each worker once.
+    with ProcessPoolExecutor(
+        initializer=_init_worker,
+        initargs=(player_teams, team_rosters, output_dir),
+    ) as executor:
+        # Generate individual player pages
+        print("👤 Generating player pages...")
+        results = executor.map(_render_player, players, chunksize=64)
+        for i, _ in enumerate(results, 1):
+            if i % 50 == 0:
+                print(f"  Generated {i}/{len(players)} player pages...")
         
-        player_data = get_player_data(df, player)
-        generate_player_page(player_data, output_dir)
-    
-    # Generate individual team pages
-    print("🏒 Generating team pages...")
-    for i, team in enumerate(teams, 1):
-        if i % 25 == 0:
-            print(f"  Generated {i}/{len(teams)} team pages...")
+        # Generate individual team pages
+        print("🏒 Generating team pages...")
+        results = executor.map(_render_team, teams, chunksize=64)
+        for i, _ in enumerate(results, 1):
+            if i % 25 == 0:
+                print(f"  Generated {i}/{len(teams)} team pages...")
         
-        team_data = get_team_data(df, team['team_id'], team['season'])
-        if team_data:
-            generate_team_page(team_data, output_dir)
+        # Precompress every page so static hosts can serve the .gz directly
+        print("🗜️ Compressing pages...")
+        pages = list(output_dir.rglob("*.html"))
+        list(executor.map(compress_file, pages, chunksize=64))
+        print(f"Compressed {len(pages)} pages")
     
     print(f"✅ Website generation complete!")
     print(f"📍 Open {output_dir}/index.html in your browser to view the site")